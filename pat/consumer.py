@@ -21,11 +21,12 @@ if TYPE_CHECKING:
     from sdc11073.loghelper import LoggerAdapter
     from sdc11073.pysoap.msgreader import ReceivedMessage
 
+logger = logging.getLogger('pat.consumer')
+
 
 def _setup_logging():
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(step)s - %(message)s'))
-    logger = logging.getLogger('pat.consumer')
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
 
@@ -62,9 +63,11 @@ class ConsumerMdibMethodsReferenceTest(ConsumerMdibMethods):
                         old_descriptor = self._mdib.descriptions.handle.get_one(descriptor_container.Handle)
                         # test 5a.1
                         if descriptor_container.Type.ConceptDescription != old_descriptor.Type.ConceptDescription:
-                            print(
-                                f'concept description {descriptor_container.Type.ConceptDescription} <=> '
-                                f'{old_descriptor.Type.ConceptDescription}',
+                            logger.debug(
+                                'concept description %s <=> %s',
+                                descriptor_container.Type.ConceptDescription,
+                                old_descriptor.Type.ConceptDescription,
+                                extra={'step': '5a'},
                             )
                             self.alert_condition_type_concept_updates.append(
                                 now - self._last_alert_condition_type_concept_updates,
@@ -74,16 +77,23 @@ class ConsumerMdibMethodsReferenceTest(ConsumerMdibMethods):
                         # (CauseInfo is a list)
                         detected_5a2 = False
                         if len(descriptor_container.CauseInfo) != len(old_descriptor.CauseInfo):
-                            print(
-                                f'RemedyInfo no. of CauseInfo {len(descriptor_container.CauseInfo)} <=> '
-                                f'{len(old_descriptor.CauseInfo)}',
+                            logger.debug(
+                                'RemedyInfo no. of CauseInfo %d <=> %d',
+                                len(descriptor_container.CauseInfo),
+                                len(old_descriptor.CauseInfo),
+                                extra={'step': '5a'},
                             )
                             detected_5a2 = True
                         else:
                             for i, cause_info in enumerate(descriptor_container.CauseInfo):
                                 old_cause_info = old_descriptor.CauseInfo[i]
                                 if cause_info.RemedyInfo != old_cause_info.RemedyInfo:
-                                    print(f'RemedyInfo {cause_info.RemedyInfo} <=> {old_cause_info.RemedyInfo}')
+                                    logger.debug(
+                                        'RemedyInfo %s <=> %s',
+                                        cause_info.RemedyInfo,
+                                        old_cause_info.RemedyInfo,
+                                        extra={'step': '5a'},
+                                    )
                                     detected_5a2 = True
                         if detected_5a2:
                             self.alert_condition_cause_remedy_updates.append(
@@ -138,40 +148,45 @@ def run_ref_test(  # noqa: PLR0913, PLR0915
         mdib = ConsumerMdib(consumer, extras_cls=ConsumerMdibMethodsReferenceTest)
         mdib.init_mdib()
 
-        with futures.ThreadPoolExecutor() as pool:
-            thread_test_4a = pool.submit(step_4.test_4a, mdib)
-            thread_test_4b = pool.submit(step_4.test_4b, mdib)
-            thread_test_4c = pool.submit(step_4.test_4c, mdib)
-            thread_test_4d = pool.submit(step_4.test_4d, mdib)
-            thread_test_4e = pool.submit(step_4.test_4e, mdib)
-            thread_test_4f = pool.submit(step_4.test_4f, mdib, network_delay)
-            thread_test_4g = pool.submit(step_4.test_4g, mdib)
-            thread_test_4h = pool.submit(step_4.test_4h, mdib)
-            thread_test_4i = pool.submit(step_4.test_4i, mdib, network_delay)
-            thread_test_5a = pool.submit(step_5.test_5a, mdib)
-            thread_test_5b = pool.submit(step_5.test_5b, mdib)
-            thread_test_6b = pool.submit(step_6.test_6b, consumer)
-            thread_test_6c = pool.submit(step_6.test_6c, consumer)
-            thread_test_6d = pool.submit(step_6.test_6d, consumer)
-            thread_test_6e = pool.submit(step_6.test_6e, consumer)
-            thread_test_6f = pool.submit(step_6.test_6f, consumer)
-
-            test_4a = thread_test_4a.result()
-            test_4b = thread_test_4b.result()
-            test_4c = thread_test_4c.result()
-            test_4d = thread_test_4d.result()
-            test_4e = thread_test_4e.result()
-            test_4f = thread_test_4f.result()
-            test_4g = thread_test_4g.result()
-            test_4h = thread_test_4h.result()
-            test_4i = thread_test_4i.result()
-            test_5a = thread_test_5a.result()
-            test_5b = thread_test_5b.result()
-            test_6b = thread_test_6b.result()
-            test_6c = thread_test_6c.result()
-            test_6d = thread_test_6d.result()
-            test_6e = thread_test_6e.result()
-            test_6f = thread_test_6f.result()
+        # every test observes the provider for a while, give each one its own thread so that they really overlap
+        concurrent_tests = [
+            (step_4.test_4a, mdib),
+            (step_4.test_4b, mdib),
+            (step_4.test_4c, mdib),
+            (step_4.test_4d, mdib),
+            (step_4.test_4e, mdib),
+            (step_4.test_4f, mdib, network_delay),
+            (step_4.test_4g, mdib),
+            (step_4.test_4h, mdib),
+            (step_4.test_4i, mdib, network_delay),
+            (step_5.test_5a, mdib),
+            (step_5.test_5b, mdib),
+            (step_6.test_6b, consumer),
+            (step_6.test_6c, consumer),
+            (step_6.test_6d, consumer),
+            (step_6.test_6e, consumer),
+            (step_6.test_6f, consumer),
+        ]
+        with futures.ThreadPoolExecutor(max_workers=len(concurrent_tests)) as pool:
+            pending = [pool.submit(*test) for test in concurrent_tests]
+            (
+                test_4a,
+                test_4b,
+                test_4c,
+                test_4d,
+                test_4e,
+                test_4f,
+                test_4g,
+                test_4h,
+                test_4i,
+                test_5a,
+                test_5b,
+                test_6b,
+                test_6c,
+                test_6d,
+                test_6e,
+                test_6f,
+            ) = [future.result() for future in pending]
     finally:
         consumer.stop_all()
 
@@ -171,7 +171,7 @@ def test_6b(consumer: SdcConsumer) -> bool:  # noqa: C901
     return any(test_results) and all(test_results)
 
 
-def test_6c(consumer: SdcConsumer) -> bool:
+def test_6c(consumer: SdcConsumer) -> bool:  # noqa: PLR0912
     """The Reference Consumer invokes SetValue:
     - The Reference Provider immediately responds with Fin
     - The Reference Provider sends Fin as a report in addition to the response
@@ -185,7 +185,9 @@ def test_6c(consumer: SdcConsumer) -> bool:
     if not operations_:
         logger.error('The reference provider provides no set value operations', extra={'step': step})
         return False
-    test_results: list[bool] = []
+    # invoke all operations first, then wait for the results => operations are processed concurrently.
+    # The timeout of an operation starts when it is invoked, not when its result is awaited.
+    pending: list[tuple[float, float, Future[operations.OperationResult]]] = []
     for operation in operations_:
         state: statecontainers.SetValueOperationStateContainer = consumer.mdib.states.descriptor_handle.get_one(
             operation.Handle,
@@ -194,10 +196,6 @@ def test_6c(consumer: SdcConsumer) -> bool:
             value = random.randint(1, 10000)
         else:
             value = random.choice([state.AllowedRange[0].Lower, state.AllowedRange[0].Upper])
-        fut: Future[operations.OperationResult] = set_service.set_numeric_value(
-            operation.Handle,
-            value,
-        )
         if operation.MaxTimeToFinish is None:
             timeout = 10.0
             logger.warning(
@@ -208,8 +206,12 @@ def test_6c(consumer: SdcConsumer) -> bool:
             )
         else:
             timeout = operation.MaxTimeToFinish
+        pending.append((timeout, time.monotonic() + timeout, set_service.set_numeric_value(operation.Handle, value)))
+
+    test_results: list[bool] = []
+    for timeout, deadline, fut in pending:
         try:
-            operation_result = fut.result(timeout)
+            operation_result = fut.result(max(0.0, deadline - time.monotonic()))
         except TimeoutError:
             logger.exception(
                 'SetNumericValue operation not finished within the timeout of %s seconds',
@@ -278,7 +280,16 @@ def test_6d(consumer: SdcConsumer) -> bool:  # noqa: C901, PLR0912
         logger.error('The reference provider provides no set string operations', extra={'step': step})
         return False
 
-    test_results: list[bool] = []
+    # invoke all operations first, then wait for the results => operations are processed concurrently.
+    # The timeout of an operation starts when it is invoked, not when its result is awaited.
+    pending: list[
+        tuple[
+            descriptorcontainers.SetStringOperationDescriptorContainer,
+            float,
+            float,
+            Future[operations.OperationResult],
+        ]
+    ] = []
     for operation in operations_:
         target = consumer.mdib.descriptions.handle.get_one(operation.OperationTarget)
         if not isinstance(target, descriptorcontainers.EnumStringMetricDescriptorContainer):
@@ -291,7 +302,6 @@ def test_6d(consumer: SdcConsumer) -> bool:  # noqa: C901, PLR0912
             value_to_be_set = random.choice(set_string_operation_state.AllowedValues.Value)
         else:
             value_to_be_set = random.choice([allowed_value.Value for allowed_value in target.AllowedValue])
-
         if operation.MaxTimeToFinish is None:
             timeout = 10.0
             logger.warning(
@@ -302,9 +312,14 @@ def test_6d(consumer: SdcConsumer) -> bool:  # noqa: C901, PLR0912
             )
         else:
             timeout = operation.MaxTimeToFinish
-        fut: Future[operations.OperationResult] = set_service.set_string(operation.Handle, value_to_be_set)
+        pending.append(
+            (operation, timeout, time.monotonic() + timeout, set_service.set_string(operation.Handle, value_to_be_set)),
+        )
+
+    test_results: list[bool] = []
+    for operation, timeout, deadline, fut in pending:
         try:
-            operation_result = fut.result(timeout)
+            operation_result = fut.result(max(0.0, deadline - time.monotonic()))
         except TimeoutError:
             logger.exception(
                 'The SetString operation with the handle %s did not finish within the timeout of %s seconds',
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import datetime
+import logging
 import pathlib
 import random
-import traceback
 from decimal import Decimal
 from time import sleep
 from typing import TYPE_CHECKING
@@ -37,6 +37,12 @@ vmd_handle = 'vmd_0.mds_0'
 mds_handle = 'mds_0'
 USE_REFERENCE_PARAMETERS = False
 
+# increments of the periodically updated values, created once instead of in every update cycle
+NUMERIC_METRIC_INCREMENT = Decimal(1)
+BATTERY_VOLTAGE_INCREMENT = Decimal('0.1')
+
+logger = logging.getLogger('pat.provider')
+
 # some switches to enable/disable some of the provider data updates
 # enabling allows to verify that the reference consumer detects missing updates
 
@@ -264,87 +270,82 @@ def run_provider(  # noqa: C901, PLR0912, PLR0915
         identifiers = []
         patient_container.Identification = identifiers
 
-    all_descriptors = list(sdc_provider.mdib.descriptions.objects)
-    all_descriptors.sort(key=lambda x: x.Handle)
-    numeric_metric = None
-    string_metric = None
-    alert_condition = None
-    alert_signal = None
-    battery_descriptor = None
-    string_operation = None
-    value_operation = None
-
-    # search for descriptors of specific types
-    for one_descriptor in all_descriptors:
-        if one_descriptor.Handle == numeric_metric_handle:
-            numeric_metric = one_descriptor
-        if one_descriptor.Handle == string_metric_handle:
-            string_metric = one_descriptor
-        if one_descriptor.Handle == alert_condition_handle:
-            alert_condition = one_descriptor
-        if one_descriptor.Handle == alert_signal_handle:
-            alert_signal = one_descriptor
-        if one_descriptor.Handle == battery_handle:
-            battery_descriptor = one_descriptor
-        if one_descriptor.Handle == set_value_handle:
-            value_operation = one_descriptor
-        if one_descriptor.Handle == set_string_handle:
-            string_operation = one_descriptor
+    # look up the descriptors of specific handles
+    descriptor_by_handle = sdc_provider.mdib.descriptions.handle
+    numeric_metric = descriptor_by_handle.get_one(numeric_metric_handle, allow_none=True)
+    string_metric = descriptor_by_handle.get_one(string_metric_handle, allow_none=True)
+    alert_condition = descriptor_by_handle.get_one(alert_condition_handle, allow_none=True)
+    alert_signal = descriptor_by_handle.get_one(alert_signal_handle, allow_none=True)
+    battery_descriptor = descriptor_by_handle.get_one(battery_handle, allow_none=True)
+    value_operation = descriptor_by_handle.get_one(set_value_handle, allow_none=True)
+    string_operation = descriptor_by_handle.get_one(set_string_handle, allow_none=True)
 
     with sdc_provider.mdib.metric_state_transaction() as mgr:
-        state = mgr.get_state(value_operation.OperationTarget)
-        if not state.MetricValue:
-            state.mk_metric_value()
-        state = mgr.get_state(string_operation.OperationTarget)
-        if not state.MetricValue:
-            state.mk_metric_value()
+        metric_handles = {value_operation.OperationTarget, string_operation.OperationTarget}
+        metric_handles.update(metric.Handle for metric in (numeric_metric, string_metric) if metric)
+        for metric_handle in metric_handles:
+            state = mgr.get_state(metric_handle)
+            if not state.MetricValue:
+                state.mk_metric_value()
+    # only open the per cycle transactions if they have something to update
+    update_numeric_metric = bool(numeric_metric and enable_4a)
+    update_string_metric = bool(string_metric and enable_4b)
+    update_alert_condition = bool(alert_condition and enable_4c)
+    update_alert_signal = bool(alert_signal and enable_4d)
     print('Running forever, CTRL-C to  exit')
     try:
         str_current_value = 0
         while True:
-            if numeric_metric:
+            if not numeric_metric:
+                logger.warning('Numeric Metric not found in MDIB!')
+            if not string_metric:
+                logger.warning('String Metric not found in MDIB!')
+            if update_numeric_metric or update_string_metric:
                 try:
-                    if enable_4a:
-                        with sdc_provider.mdib.metric_state_transaction() as mgr:
+                    # numeric and string metric updates are committed in one transaction => one report per cycle
+                    with sdc_provider.mdib.metric_state_transaction() as mgr:
+                        if update_numeric_metric:
                             state = mgr.get_state(numeric_metric.Handle)
-                            if not state.MetricValue:
-                                state.mk_metric_value()
                             if state.MetricValue.Value is None:
                                 state.MetricValue.Value = Decimal(0)
                             else:
-                                state.MetricValue.Value += Decimal(1)
-                    if enable_5a3:
-                        with sdc_provider.mdib.descriptor_transaction() as mgr:
-                            descriptor: descriptorcontainers.AbstractMetricDescriptorContainer = mgr.get_descriptor(
-                                numeric_metric.Handle,
-                            )
-                            descriptor.Unit.Code = 'code1' if descriptor.Unit.Code == 'code2' else 'code2'
-                except Exception:  # noqa: BLE001
-                    print(traceback.format_exc())
-            else:
-                print('Numeric Metric not found in MDIB!')
-            if string_metric:
-                try:
-                    if enable_4b:
-                        with sdc_provider.mdib.metric_state_transaction() as mgr:
+                                state.MetricValue.Value += NUMERIC_METRIC_INCREMENT
+                        if update_string_metric:
                             state = mgr.get_state(string_metric.Handle)
-                            if not state.MetricValue:
-                                state.mk_metric_value()
                             state.MetricValue.Value = f'my string {str_current_value}'
                             str_current_value += 1
-                except Exception:  # noqa: BLE001
-                    print(traceback.format_exc())
-            else:
-                print('Numeric Metric not found in MDIB!')
-
-            if alert_condition:
+                except Exception:
+                    logger.exception('metric state update failed')
+            if numeric_metric and enable_5a3:
                 try:
-                    if enable_4c:
-                        with sdc_provider.mdib.alert_state_transaction() as mgr:
+                    with sdc_provider.mdib.descriptor_transaction() as mgr:
+                        descriptor: descriptorcontainers.AbstractMetricDescriptorContainer = mgr.get_descriptor(
+                            numeric_metric.Handle,
+                        )
+                        descriptor.Unit.Code = 'code1' if descriptor.Unit.Code == 'code2' else 'code2'
+                except Exception:
+                    logger.exception('numeric metric descriptor update failed')
+
+            if not alert_condition:
+                logger.warning('Alert condition not found in MDIB')
+            if not alert_signal:
+                logger.warning('Alert signal not found in MDIB')
+            if update_alert_condition or update_alert_signal:
+                try:
+                    # alert condition and alert signal updates are committed in one transaction
+                    with sdc_provider.mdib.alert_state_transaction() as mgr:
+                        if update_alert_condition:
                             state = mgr.get_state(alert_condition.Handle)
                             state.Presence = not state.Presence
-                except Exception:  # noqa: BLE001
-                    print(traceback.format_exc())
+                        if update_alert_signal:
+                            state = mgr.get_state(alert_signal.Handle)
+                            if state.Slot is None:
+                                state.Slot = 1
+                            else:
+                                state.Slot += 1
+                except Exception:
+                    logger.exception('alert state update failed')
+            if alert_condition:
                 try:
                     with sdc_provider.mdib.descriptor_transaction() as mgr:
                         now = datetime.datetime.now(tz=datetime.UTC)
@@ -366,25 +367,8 @@ def run_provider(  # noqa: C901, PLR0912, PLR0915
                                 descriptor.CauseInfo[0].RemedyInfo.Description.append(pm_types.LocalizedText(text))
                             else:
                                 descriptor.CauseInfo[0].RemedyInfo.Description[0].text = text
-                except Exception:  # noqa: BLE001
-                    print(traceback.format_exc())
-
-            else:
-                print('Alert condition not found in MDIB')
-
-            if alert_signal:
-                try:
-                    if enable_4d:
-                        with sdc_provider.mdib.alert_state_transaction() as mgr:
-                            state = mgr.get_state(alert_signal.Handle)
-                            if state.Slot is None:
-                                state.Slot = 1
-                            else:
-                                state.Slot += 1
-                except Exception:  # noqa:BLE001
-                    print(traceback.format_exc())
-            else:
-                print('Alert signal not found in MDIB')
+                except Exception:
+                    logger.exception('alert condition descriptor update failed')
 
             if battery_descriptor:
                 try:
@@ -393,28 +377,28 @@ def run_provider(  # noqa: C901, PLR0912, PLR0915
                         if state.Voltage is None:
                             state.Voltage = pm_types.Measurement(value=Decimal('14.4'), unit=pm_types.CodedValue('xyz'))
                         else:
-                            state.Voltage.MeasuredValue += Decimal('0.1')
-                        print(f'battery voltage = {state.Voltage.MeasuredValue}')
-                except Exception:  # noqa:BLE001
-                    print(traceback.format_exc())
+                            state.Voltage.MeasuredValue += BATTERY_VOLTAGE_INCREMENT
+                        logger.debug('battery voltage = %s', state.Voltage.MeasuredValue)
+                except Exception:
+                    logger.exception('battery state update failed')
             else:
-                print('battery state not found in MDIB')
+                logger.warning('battery state not found in MDIB')
 
             try:
                 with sdc_provider.mdib.component_state_transaction() as mgr:
                     state = mgr.get_state(vmd_handle)
                     state.OperatingHours = 2 if state.OperatingHours != 2 else 1  # noqa:PLR2004
-                    print(f'operating hours = {state.OperatingHours}')
-            except Exception:  # noqa:BLE001
-                print(traceback.format_exc())
+                    logger.debug('operating hours = %s', state.OperatingHours)
+            except Exception:
+                logger.exception('vmd state update failed')
 
             try:
                 with sdc_provider.mdib.component_state_transaction() as mgr:
                     state = mgr.get_state(mds_handle)
                     state.Lang = 'de' if state.Lang != 'de' else 'en'
-                    print(f'mds lang = {state.Lang}')
-            except Exception:  # noqa:BLE001
-                print(traceback.format_exc())
+                    logger.debug('mds lang = %s', state.Lang)
+            except Exception:
+                logger.exception('mds state update failed')
 
             # add or rm vmd
             # Generate unique handles on each insertion to avoid recycling containment tree entries (PAT 5b requirement)
@@ -461,7 +445,7 @@ def run_provider(  # noqa: C901, PLR0912, PLR0915
                     if op_state.OperatingMode == pm_types.OperatingMode.ENABLED
                     else pm_types.OperatingMode.DISABLED
                 )
-                print(f'operation activate_0.sco.mds_0 {op_state.OperatingMode}')
+                logger.debug('operation activate_0.sco.mds_0 %s', op_state.OperatingMode)
 
             sleep(5)
     except KeyboardInterrupt:
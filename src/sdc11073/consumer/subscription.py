@@ -341,7 +341,7 @@ class ConsumerSubscriptionManagerProtocol(Protocol):
         get_soap_client_func: Callable[[str], SoapClientProtocol],
         notification_url: str,
         end_to_url: str | None = None,
-        fixed_renew_interval: int | None = None,
+        fixed_renew_interval: float | None = None,
         log_prefix: str = '',
     ):
         """Construct a ConsumerSubscriptionManager.
@@ -393,7 +393,7 @@ class ConsumerSubscriptionManager(
         get_soap_client_func: Callable[[str], SoapClientProtocol],
         notification_url: str,
         end_to_url: str | None = None,
-        fixed_renew_interval: int | None = None,
+        fixed_renew_interval: float | None = None,
         log_prefix: str = '',
     ):
         """Construct a ConsumerSubscriptionManager.
@@ -416,6 +416,7 @@ class ConsumerSubscriptionManager(
         self._subscriptions_lock = threading.Lock()
 
         self._run = False
+        self._stop_event = threading.Event()  # allows to interrupt waiting in the renew loops immediately
         self._notification_url = notification_url
         self._end_to_url = end_to_url or notification_url
         self._logger = loghelper.get_logger_adapter('sdc.client.subscrMgr', log_prefix)
@@ -425,6 +426,7 @@ class ConsumerSubscriptionManager(
     def stop(self):
         """Stop the thread."""
         self._run = False
+        self._stop_event.set()
         self.join(timeout=2)
         with self._subscriptions_lock:
             self.subscriptions.clear()
@@ -444,10 +446,8 @@ class ConsumerSubscriptionManager(
         """Renew subscriptions in a fixed period."""
         while self._run:
             try:
-                for _ in range(self._renew_interval):
-                    time.sleep(1)
-                    if not self._run:
-                        return
+                if self._stop_event.wait(self._renew_interval):
+                    return
                 with self._subscriptions_lock:
                     # copy list of subscriptions in order to release lock early
                     subscriptions = list(self.subscriptions.values())
@@ -463,8 +463,7 @@ class ConsumerSubscriptionManager(
         """Renew subscriptions when remaining time <= 50% of granted time."""
         while self._run:
             try:
-                time.sleep(1)
-                if not self._run:
+                if self._stop_event.wait(1):
                     return
                 with self._subscriptions_lock:
                     # copy list of subscriptions in order to release lock early
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import pathlib
-from enum import Enum
-from typing import NamedTuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from lxml import etree
 
 from sdc11073 import xml_utils
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+@functools.lru_cache(maxsize=4096)
+def _mk_qname(namespace: str | None, localname: str) -> xml_utils.QName:
+    """Return a shared QName instance. QNames are immutable, so identical names can use the same object."""
+    return xml_utils.QName(namespace, localname)
+
 
 class PrefixNamespace(NamedTuple):
     """Represents a namespace with an optional prefix and schema location."""
@@ -20,8 +30,8 @@ class PrefixNamespace(NamedTuple):
     local_schema_file: pathlib.Path | None
 
     def tag(self, localname: str) -> xml_utils.QName:
-        """Create a QName for the given localname."""
-        return xml_utils.QName(self.namespace, localname)
+        """Get the QName for the given localname."""
+        return _mk_qname(self.namespace, localname)
 
     def doc_name(self, localname: str) -> str:
         """Get the string representation with an optional prefix."""
@@ -33,8 +43,33 @@ class PrefixNamespace(NamedTuple):
 schema_folder = pathlib.Path(__file__).parent.joinpath('xsd')
 
 
-class PrefixesEnum(PrefixNamespace, Enum):
-    """Enum for various XML namespaces with prefixes."""
+class _PrefixesMeta(type):
+    """Metaclass that makes the PrefixNamespace class attributes of a class iterable, similar to an Enum."""
+
+    def __init__(cls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]):
+        super().__init__(name, bases, namespace)
+        members = {}
+        for klass in reversed(cls.__mro__):
+            members.update({k: v for k, v in vars(klass).items() if isinstance(v, PrefixNamespace)})
+        cls._members = members
+
+    @property
+    def __members__(cls) -> Mapping[str, PrefixNamespace]:
+        return MappingProxyType(cls._members)
+
+    def __iter__(cls) -> Iterator[PrefixNamespace]:
+        return iter(cls._members.values())
+
+    def __len__(cls) -> int:
+        return len(cls._members)
+
+
+class PrefixesEnum(metaclass=_PrefixesMeta):
+    """Various XML namespaces with prefixes.
+
+    The members are plain PrefixNamespace instances (not Enum members), class attribute access is cheap.
+    Iterating over the class and __members__ work like for an Enum.
+    """
 
     MSG = PrefixNamespace(
         'msg',
@@ -124,91 +159,56 @@ class PrefixesEnum(PrefixNamespace, Enum):
 class NamespaceHelper:
     """A helper class for managing XML namespaces and their prefixes."""
 
+    _NAMESPACE_NAMES = tuple(PrefixesEnum.__members__)
+
+    __slots__ = ('_default_ns', '_lookup', '_prefix_colon_map', 'ns_map', 'prefix_enum', *_NAMESPACE_NAMES)
+
+    # the namespaces are plain instance attributes (set in __init__), this avoids a property call per access
+    MSG: PrefixNamespace
+    PM: PrefixNamespace
+    EXT: PrefixNamespace
+    MDPWS: PrefixNamespace
+    SDC: PrefixNamespace
+    WSE: PrefixNamespace
+    XSD: PrefixNamespace
+    XSI: PrefixNamespace
+    WSA: PrefixNamespace
+    WSX: PrefixNamespace
+    DPWS: PrefixNamespace
+    WSD: PrefixNamespace
+    S12: PrefixNamespace
+    XML: PrefixNamespace
+    WXF: PrefixNamespace
+    WSDL: PrefixNamespace
+    WSDL12: PrefixNamespace
+    WSP: PrefixNamespace
+
     def __init__(self, prefixes_enum: type[PrefixesEnum], default_ns: str | None = None):
         self.prefix_enum = prefixes_enum
-        self._lookup = {}
-        for enum_item in prefixes_enum:
-            self._lookup[enum_item.name] = enum_item.value
+        self._lookup = dict(prefixes_enum.__members__)
+        for name in self._NAMESPACE_NAMES:
+            setattr(self, name, self._lookup[name])
 
         self._default_ns = default_ns
 
-        self._prefix_map = {x.namespace: x.prefix for x in self._lookup.values()}  # map namespace to prefix
-        self.ns_map = {x.prefix: x.namespace for x in self._lookup.values()}  # map prefix to namespace
-
-    @property
-    def MSG(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['MSG']
-
-    @property
-    def PM(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['PM']
-
-    @property
-    def EXT(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['EXT']
-
-    @property
-    def SDC(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['SDC']
-
-    @property
-    def WSE(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSE']
-
-    @property
-    def XSI(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['XSI']
-
-    @property
-    def WSA(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSA']
-
-    @property
-    def WSX(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSX']
-
-    @property
-    def DPWS(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['DPWS']
-
-    @property
-    def MDPWS(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['MDPWS']
-
-    @property
-    def WSD(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSD']
-
-    @property
-    def S12(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['S12']
-
-    @property
-    def XML(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['XML']
-
-    @property
-    def WSDL(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSDL']
-
-    @property
-    def WSDL12(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSDL12']
-
-    @property
-    def WSP(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WSP']
-
-    @property
-    def WXF(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['WXF']
-
-    @property
-    def XSD(self) -> PrefixNamespace:  # noqa: D102, N802
-        return self._lookup['XSD']
+        # map namespace to "prefix:", ready to be concatenated with a localname.
+        # The default namespace maps to an empty string, so that doc_name_from_qname needs no special case for it.
+        prefix_colon_map = {x.namespace: f'{x.prefix}:' for x in self._lookup.values()}
+        if default_ns is not None:
+            prefix_colon_map[default_ns] = ''
+        self._prefix_colon_map = MappingProxyType(prefix_colon_map)
+        # map prefix to namespace. This stays a dict, because lxml only accepts a dict as xpath namespaces.
+        # It must not be modified.
+        self.ns_map = {x.prefix: x.namespace for x in self._lookup.values()}
 
     def partial_map(self, *prefix: PrefixNamespace) -> dict:
         """Get a dictionary with prefix as key, namespace as value."""
+        if self._default_ns is None:
+            # no default namespace => no need to compare every namespace against it
+            ret = {}
+            for p in prefix:
+                ret[p.prefix] = p.namespace
+            return ret
         ret = {}
         for p in prefix:
             if p.namespace == self._default_ns:
@@ -218,10 +218,7 @@ class NamespaceHelper:
 
     def doc_name_from_qname(self, qname: etree.QName) -> str:
         """Get the prefix:name string, or only name (if default namespace is used)."""
-        if qname.namespace is not None and qname.namespace == self._default_ns:
-            return qname.localname
-        prefix = self._prefix_map[qname.namespace]
-        return f'{prefix}:{qname.localname}'
+        return self._prefix_colon_map[qname.namespace] + qname.localname
 
     def text_to_qname(self, text: str, nsmap: dict[str, str] | None = None) -> etree.QName:
         """Convert a text to a qname."""
@@ -238,8 +235,13 @@ WSA_NONE = PrefixesEnum.WSA.namespace + '/none'
 
 def docname_from_qname(qname: etree.QName, ns_map: dict) -> str:
     """Get a prefix:name string, or only name (if default namespace is used)."""
-    prefixmap = {v: k for k, v in ns_map.items()}
-    prefix = prefixmap.get(qname.namespace)
+    # ns_map is typically a node.nsmap, which lxml creates anew on every access. Caching an inverted map is
+    # therefore not possible; scan it without building an inverted dict instead (last matching prefix wins).
+    namespace = qname.namespace
+    prefix = None
+    for key, value in ns_map.items():
+        if value == namespace:
+            prefix = key
     if prefix is None:
         return qname.localname
     return f'{prefix}:{qname.localname}'
@@ -247,11 +249,12 @@ def docname_from_qname(qname: etree.QName, ns_map: dict) -> str:
 
 def text_to_qname(text: str, doc_nsmap: dict[str, str]) -> xml_utils.QName:
     """Convert a text to a qname."""
-    elements = text.split(':')
-    prefix = None if len(elements) == 1 else elements[0]
-    name = elements[-1]
+    prefix, sep, name = text.partition(':')
+    if not sep:
+        prefix = None
+        name = text
     try:
-        return xml_utils.QName(doc_nsmap[prefix], name)
+        return _mk_qname(doc_nsmap[prefix], name)
     except KeyError as ex:
         raise KeyError(f'Cannot make QName for {text}, prefix is not in nsmap: {doc_nsmap.keys()}') from ex  # noqa: EM102
 
@@ -7,7 +7,7 @@ import socket
 import time
 import uuid
 from collections import deque
-from threading import Thread
+from threading import Event, Thread
 from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlparse
 
@@ -361,7 +361,7 @@ class SubscriptionsManagerBase:
         self._subscriptions.add_index('netloc', multikey.IndexDefinition(lambda obj: obj.notify_to_url.netloc))
         self.base_urls: Sequence[urllib.parse.SplitResult] | None = None
         self._housekeeping_thread = Thread(target=self._do_housekeeping, name='housekeeping', daemon=True)
-        self._run_housekeeping_thread = False
+        self._stop_housekeeping_event = Event()
         self._housekeeping_thread.start()
 
     def set_base_urls(self, base_urls: Sequence[urllib.parse.SplitResult]):
@@ -458,7 +458,7 @@ class SubscriptionsManagerBase:
         self._logger.info('stop_all called')
         # stop housekeeping thread first to get it out of the way
         self._logger.debug('stop housekeeping thread')
-        self._run_housekeeping_thread = False
+        self._stop_housekeeping_event.set()
         self._housekeeping_thread.join()
         self._logger.debug('housekeeping thread stopped')
         self._logger.debug('end all subscriptions')
@@ -545,9 +545,7 @@ class SubscriptionsManagerBase:
 
     def _do_housekeeping(self):
         """Remove expired or invalid subscriptions. Method is executed in a thread."""
-        self._run_housekeeping_thread = True
-        while self._run_housekeeping_thread:
-            time.sleep(1)
+        while not self._stop_housekeeping_event.wait(1):
             now = time.time()
             with self._subscriptions.lock:
                 obsolete_subscriptions = [
@@ -39,7 +39,7 @@ class MessageFactory:
                  additional_schema_specs: Union[List[PrefixNamespace], None],
                  logger,
                  validate=True):
-        self.schema_specs = [entry.value for entry in sdc_definitions.data_model.ns_helper.prefix_enum]
+        self.schema_specs = list(sdc_definitions.data_model.ns_helper.prefix_enum)
         if additional_schema_specs is not None:
             self.schema_specs.extend(additional_schema_specs)
         self._logger = logger
@@ -20,7 +20,6 @@ from lxml import etree
 from sdc11073 import commlog, observableproperties
 from sdc11073.httpserver.compression import CompressionHandler
 from sdc11073.httpserver.httpreader import HTTPReader, mk_chunks
-from sdc11073.namespaces import default_ns_helper as ns_hlp
 from sdc11073.pysoap.soapenvelope import Fault
 
 if TYPE_CHECKING:
@@ -258,7 +257,7 @@ class SoapClient:
             return None
 
         message_data = self._msg_reader.read_received_message(xml_response)
-        if message_data.action == f'{ns_hlp.WSA.namespace}/fault':
+        if message_data.action == Fault.action:
             soap_fault = Fault.from_node(message_data.p_msg.msg_node)
             raise HTTPReturnCodeError(http_response.status, http_response.reason, soap_fault)
         return message_data
@@ -9,7 +9,6 @@ from aiohttp.client import ClientSession, ClientTimeout, TCPConnector
 from sdc11073 import commlog, observableproperties
 from sdc11073.httpserver.compression import CompressionHandler
 from sdc11073.httpserver.httpreader import mk_chunks
-from sdc11073.namespaces import default_ns_helper as ns_hlp
 from sdc11073.pysoap.soapenvelope import Fault
 
 from .soapclient import HTTPReturnCodeError
@@ -152,7 +151,7 @@ class SoapClientAsync:
             return None
 
         message_data = self._msg_reader.read_received_message(xml_response.encode('utf-8'))
-        if message_data.action == f'{ns_hlp.WSA.namespace}/fault':
+        if message_data.action == Fault.action:
             soap_fault = Fault.from_node(message_data.p_msg.msg_node)
             raise HTTPReturnCodeError(resp.status, resp.reason, soap_fault)
         return message_data
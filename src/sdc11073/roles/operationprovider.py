@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sdc11073 import xml_utils
+from sdc11073.namespaces import PrefixesEnum
 from sdc11073.provider.operations import ActivateOperation, ExecuteParameters, ExecuteResult, OperationDefinitionBase
 from sdc11073.roles import providerbase
 
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
     from sdc11073.xml_types.pm_types import ActivateOperationDescriptorArgument
 
 
+# argument types used by the plug-a-thon
+_XSD_STRING = PrefixesEnum.XSD.tag('string')
+_XSD_DECIMAL = PrefixesEnum.XSD.tag('decimal')
+_XSD_ANY_URI = PrefixesEnum.XSD.tag('anyURI')
+
+
 class OperationProvider(providerbase.ProviderRole):
     """Handle operations that work on operation states.
 
@@ -34,11 +40,11 @@ class OperationProvider(providerbase.ProviderRole):
             description: ActivateOperationDescriptorArgument
             value: msg_types.Argument
             # these are types from the plug-a-thon. add more if needed
-            if description.Arg == xml_utils.QName('{http://www.w3.org/2001/XMLSchema}string'):
+            if description.Arg == _XSD_STRING:
                 pass  # value is already a string. no need to check for correct type
-            elif description.Arg == xml_utils.QName('{http://www.w3.org/2001/XMLSchema}decimal'):
+            elif description.Arg == _XSD_DECIMAL:
                 float(value.ArgValue)  # just check if it's a valid decimal
-            elif description.Arg == xml_utils.QName('{http://www.w3.org/2001/XMLSchema}anyURI'):
+            elif description.Arg == _XSD_ANY_URI:
                 pass  # TODO: check for type  # noqa: FIX002, TD002, TD003
             else:
                 msg = f'{description.Arg} is not implemented'
@@ -23,7 +23,7 @@ class GenericPatientContextProvider(GenericContextProvider):
 
     def __init__(self, mdib: ProviderMdibProtocol, log_prefix: str | None):
         super().__init__(mdib, log_prefix=log_prefix)
-        self._patient_context_entity = None
+        self._patient_context_handle: str | None = None
         self._set_patient_context_operations = []
 
     def init_operations(self, sco: AbstractScoOperationsRegistry):
@@ -32,14 +32,14 @@ class GenericPatientContextProvider(GenericContextProvider):
         pm_names = self._mdib.data_model.pm_names
         entities = self._mdib.entities.by_node_type(pm_names.PatientContextDescriptor)
         if len(entities) == 1:
-            self._patient_context_entity = entities[0]
+            self._patient_context_handle = entities[0].handle
 
     def make_operation_instance(self,
                                 operation_descriptor_container: AbstractOperationDescriptorProtocol,
                                 operation_cls_getter: OperationClassGetter) -> OperationDefinitionBase | None:
         """Add Operation Handler if operation target is the previously found PatientContextDescriptor."""
-        if self._patient_context_entity is not None and \
-                operation_descriptor_container.OperationTarget == self._patient_context_entity.handle:
+        if self._patient_context_handle is not None and \
+                operation_descriptor_container.OperationTarget == self._patient_context_handle:
             pc_operation = self._mk_operation_from_operation_descriptor(operation_descriptor_container,
                                                                         operation_cls_getter,
                                                                         operation_handler=self._set_context_state)
@@ -56,10 +56,10 @@ class PatientContextProvider(GenericPatientContextProvider):
         pm_names = self._mdib.data_model.pm_names
         ops = []
         operation_cls_getter = sco.operation_cls_getter
-        if self._patient_context_entity is not None  and not self._set_patient_context_operations:
+        if self._patient_context_handle is not None and not self._set_patient_context_operations:
             op_cls = operation_cls_getter(pm_names.SetContextStateOperationDescriptor)
             pc_operation = op_cls('opSetPatCtx',
-                                  self._patient_context_entity.handle,
+                                  self._patient_context_handle,
                                   self._set_context_state,
                                   coded_value=None)
             ops.append(pc_operation)
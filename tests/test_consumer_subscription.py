@@ -1,6 +1,7 @@
 """Tests for consumer subscription and consumer subscription manager."""
 from __future__ import annotations
 
+import time
 from types import SimpleNamespace
 from unittest import mock
 
@@ -308,3 +309,57 @@ def test_client_subscription_manager_reference_params_find_and_unsubscribe_all()
 
     rd = RequestData({}, '/', 'peer', b'', msg)
     assert mgr_ref._find_subscription(rd, 'x') is sub_ref
+
+
+def _mk_manager(
+    mf: MessageFactory,
+    mr: MessageReader,
+    fake: FakeSoapClient,
+    fixed_renew_interval: float | None,
+) -> ConsumerSubscriptionManager:
+    return ConsumerSubscriptionManager(
+        mr,
+        mf,
+        SdcV1Definitions.data_model,
+        _make_get_soap_client(fake),
+        notification_url='http://localhost:8080/notify',
+        fixed_renew_interval=fixed_renew_interval,
+        log_prefix='t',
+    )
+
+
+def test_consumer_subscription_manager_fixed_renew_interval():
+    sdc = SdcV1Definitions
+    mf = MessageFactory(sdc, None, logger=None, validate=False)
+    mr = MessageReader(sdc, None, logger=None, validate=False)
+    fake = FakeSoapClient(mf, mr)
+    mgr = _mk_manager(mf, mr, fake, fixed_renew_interval=0.2)  # non-integer intervals are allowed
+    sub = mgr.mk_subscription(_hosted(), _filter_type('http://a/b/Action1'))
+    sub.subscribe()
+    assert sub.granted_expires == fake.subscribe_expires
+    mgr.start()
+    try:
+        deadline = time.monotonic() + 5
+        while sub.granted_expires != fake.renew_expires and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert sub.granted_expires == fake.renew_expires
+    finally:
+        started = time.monotonic()
+        mgr.stop()
+    # stop interrupts the waiting renew loop immediately
+    assert time.monotonic() - started < 0.5
+    assert not mgr.is_alive()
+
+
+def test_consumer_subscription_manager_flexible_renew_interval_stop():
+    sdc = SdcV1Definitions
+    mf = MessageFactory(sdc, None, logger=None, validate=False)
+    mr = MessageReader(sdc, None, logger=None, validate=False)
+    fake = FakeSoapClient(mf, mr)
+    mgr = _mk_manager(mf, mr, fake, fixed_renew_interval=None)
+    mgr.start()
+    started = time.monotonic()
+    mgr.stop()
+    # the renew check runs once per second, stop must not wait for it
+    assert time.monotonic() - started < 0.5
+    assert not mgr.is_alive()
@@ -27,3 +27,33 @@ class TestNamespaces(unittest.TestCase):
 
         bla_string = hlp.doc_name_from_qname(bla_tag)
         self.assertEqual('bla', bla_string)
+
+    def test_partial_map(self):
+        default_ns = namespaces.PrefixesEnum.MSG.namespace
+        hlp = namespaces.NamespaceHelper(namespaces.PrefixesEnum, default_ns)
+        ns_map = hlp.partial_map(hlp.MSG, hlp.PM)
+        self.assertEqual({None: hlp.MSG.namespace, 'msg': hlp.MSG.namespace, 'dom': hlp.PM.namespace}, ns_map)
+        # result is a copy, modifications must not affect later calls
+        ns_map['foo'] = 'bar'
+        self.assertNotIn('foo', hlp.partial_map(hlp.MSG, hlp.PM))
+        # without default namespace
+        hlp = namespaces.NamespaceHelper(namespaces.PrefixesEnum)
+        self.assertEqual({'msg': hlp.MSG.namespace, 'dom': hlp.PM.namespace}, hlp.partial_map(hlp.MSG, hlp.PM))
+
+    def test_qname_instances_are_shared(self):
+        hlp = namespaces.NamespaceHelper(namespaces.PrefixesEnum)
+        self.assertIs(hlp.PM.tag('Bla'), hlp.PM.tag('Bla'))
+        qname = namespaces.text_to_qname('dom:Bla', hlp.ns_map)
+        self.assertIs(hlp.PM.tag('Bla'), qname)
+
+    def test_prefixes_enum(self):
+        self.assertIsInstance(namespaces.PrefixesEnum.MSG, namespaces.PrefixNamespace)
+        self.assertEqual(len(namespaces.PrefixesEnum), len(list(namespaces.PrefixesEnum)))
+        self.assertIn(namespaces.PrefixesEnum.PM, list(namespaces.PrefixesEnum))
+        self.assertIs(namespaces.PrefixesEnum.__members__['WSA'], namespaces.PrefixesEnum.WSA)
+
+    def test_text_to_qname(self):
+        ns_map = {None: namespaces.PrefixesEnum.PM.namespace, 'msg': namespaces.PrefixesEnum.MSG.namespace}
+        self.assertEqual(namespaces.PrefixesEnum.MSG.tag('Bla'), namespaces.text_to_qname('msg:Bla', ns_map))
+        self.assertEqual(namespaces.PrefixesEnum.PM.tag('Bla'), namespaces.text_to_qname('Bla', ns_map))
+        self.assertRaises(KeyError, namespaces.text_to_qname, 'foo:Bla', ns_map)
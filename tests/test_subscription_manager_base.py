@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import http.client
 import socket
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -187,3 +188,15 @@ def test_send_notification_report_error_handling():
     # DocumentInvalid -> re-raised
     with pytest.raises(etree.DocumentInvalid):
         mgr._send_notification_report(DummySub(etree.DocumentInvalid('bad')), etree.Element('n'), 'act')
+
+
+def test_stop_all_stops_housekeeping_thread_immediately():
+    sdc = SdcV1Definitions
+    msg_factory = MessageFactory(sdc, None, logger=None, validate=False)
+    mgr = TestSubscriptionsManager(sdc, msg_factory, DummySoapClientPool())
+    # stop_all directly after construction: the housekeeping thread may not even have started waiting yet
+    started = time.monotonic()
+    mgr.stop_all(send_subscription_end=False)
+    # housekeeping runs once per second, stop_all must not wait for it
+    assert time.monotonic() - started < 0.5
+    assert not mgr._housekeeping_thread.is_alive()